@@ -5,10 +5,22 @@ from pathlib import Path
 
 import pytest
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-@pytest.fixture
+
+def _dumps_bytes(data) -> bytes:
+    """Serialize *data* to JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
 def sample_requirements_data():
-    """Sample ASVS requirements data for testing."""
+    """Sample ASVS requirements data for testing (shared per module; do not mutate)."""
     return [
         {
             "chapter_id": "V1",
@@ -40,11 +52,11 @@ def sample_requirements_data():
     ]
 
 
-@pytest.fixture
-def sample_json_file(tmp_path, sample_requirements_data):
-    """Create a temporary JSON file with sample data."""
-    json_path = tmp_path / "requirements.json"
-    json_path.write_text(json.dumps(sample_requirements_data), encoding="utf-8")
+@pytest.fixture(scope="module")
+def sample_json_file(tmp_path_factory, sample_requirements_data):
+    """Create a temporary JSON file with sample data (written once per module)."""
+    json_path = tmp_path_factory.mktemp("data") / "requirements.json"
+    json_path.write_bytes(_dumps_bytes(sample_requirements_data))
     return json_path
 
 
@@ -60,3 +72,17 @@ def invalid_json_file(tmp_path):
 def project_root():
     """Return the project root directory."""
     return Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="session")
+def cached_scan():
+    """Capability scan of the project root, computed once per test session."""
+    from tools.capability_scanner import scan_repo
+    return scan_repo(Path(__file__).parent.parent)
+
+
+@pytest.fixture(scope="session")
+def cached_parser():
+    """CLI argument parser, built once per test session."""
+    from tools.cli import create_parser
+    return create_parser()
@@ -1,6 +1,8 @@
 """Unit tests for the capability scanner."""
 
 import json
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -9,9 +11,19 @@ from tools.capability_scanner import (
     BASELINE_CHAPTERS,
     CAPABILITY_SIGNATURES,
     ScanResult,
+    _anchors,
+    _compile_signature,
+    _regex_signatures,
+    _signature_hit,
     scan_repo,
+    scan_repos,
 )
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 class TestScanResult:
     """Tests for ScanResult dataclass."""
@@ -24,9 +36,62 @@ class TestScanResult:
         assert r.capabilities == set()
         assert r.chapters == set()
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_uses_slots(self):
+        """ScanResult instances carry no per-instance __dict__."""
+        r = ScanResult(path=Path("/tmp"))
+        assert not hasattr(r, "__dict__")
+
+
+class TestSignatureAnchors:
+    """Tests for the literal-anchor prefilter behind signature matching."""
+
+    def test_literal_pattern_needs_no_regex(self):
+        """A pattern of plain literals is answered by the substring check alone."""
+        regex, anchors = _compile_signature(r"multer|django\.storage")
+        assert regex is None
+        assert anchors == (b"multer", b"django.storage")
+
+    def test_optional_character_not_anchored(self):
+        """A run made optional by a quantifier is not used as an anchor."""
+        assert _anchors(r"file.?upload") == (b"upload",)
+        assert _anchors(r"flask-logins?") == (b"flask-login",)
+
+    @pytest.mark.parametrize("pattern", [r"\bws\b", r"a\sb", r"(ab|cd)?e", r"[abcdef]x", r"x{2}y", r"^pg"])
+    def test_regex_syntax_disables_prefilter(self, pattern):
+        """Escapes, groups, classes, braces and anchors get no prefilter."""
+        assert _anchors(pattern) == ()
+        regex, anchors = _compile_signature(pattern)
+        assert regex is not None
+
+    @pytest.mark.parametrize(
+        ("pattern", "content"),
+        [(r"\bws\b", b"ws"), (r"a\sb", b"a b"), (r"(ab|cd)?e", b"e"), (r"@nestjs/passport", b"@NestJS/passport")],
+    )
+    def test_hit(self, pattern, content):
+        """Content matched by the regex is never rejected by the prefilter."""
+        regex, anchors = _compile_signature(pattern)
+        assert _signature_hit(regex, anchors, content, content.lower())
+
+    def test_non_word_literal_keeps_regex(self):
+        """Literal characters outside the anchor alphabet still go through the regex."""
+        regex, anchors = _compile_signature(r"@nestjs/passport")
+        assert regex is not None
+        assert not _signature_hit(regex, anchors, b"passport", b"passport")
+
 
 class TestScanRepo:
-    """Tests for scan_repo function."""
+    """Tests for scan_repo function, run against both signature-matching paths."""
+
+    @pytest.fixture(autouse=True, params=["automaton", "regex"])
+    def matcher(self, request, monkeypatch):
+        """Run each test with the Aho-Corasick automaton and with the fused-regex fallback."""
+        if request.param == "automaton":
+            if ahocorasick is None:
+                pytest.skip("pyahocorasick not installed")
+        else:
+            monkeypatch.setattr("tools.capability_scanner._KEYWORD_AUTOMATON", None)
+        return request.param
 
     def test_empty_dir(self, tmp_path):
         """Empty directory returns baseline chapters only."""
@@ -49,6 +114,13 @@ class TestScanRepo:
         result = scan_repo(tmp_path)
         assert "Express" in result.frameworks
 
+    def test_package_json_django_dependency(self, tmp_path):
+        """package.json depending on a django package adds framework."""
+        pkg = tmp_path / "package.json"
+        pkg.write_text(json.dumps({"devDependencies": {"django-livereload": "^1.0.0"}}))
+        result = scan_repo(tmp_path)
+        assert "Django" in result.frameworks
+
     def test_package_json_multer_adds_v5(self, tmp_path):
         """package.json with multer detects file upload (V5)."""
         pkg = tmp_path / "package.json"
@@ -71,6 +143,18 @@ class TestScanRepo:
         result = scan_repo(tmp_path)
         assert "Django" in result.frameworks
 
+    def test_requirements_in_fallback(self, tmp_path):
+        """requirements.in is scanned when requirements.txt is absent."""
+        (tmp_path / "requirements.in").write_text("flask\n")
+        result = scan_repo(tmp_path)
+        assert "Flask" in result.frameworks
+
+    def test_manifest_directory_ignored(self, tmp_path):
+        """A directory named like a manifest is not read."""
+        (tmp_path / "package.json").mkdir()
+        result = scan_repo(tmp_path)
+        assert result.frameworks == []
+
     def test_requirements_txt_bcrypt_adds_v11(self, tmp_path):
         """requirements.txt with bcrypt detects cryptography (V11)."""
         req = tmp_path / "requirements.txt"
@@ -78,6 +162,27 @@ class TestScanRepo:
         result = scan_repo(tmp_path)
         assert "V11" in result.chapters
 
+    def test_overlapping_signatures_all_detected(self, tmp_path):
+        """A dependency matching several chapters' signatures maps to each of them."""
+        req = tmp_path / "requirements.txt"
+        req.write_text("PyJWT>=2.0\n")
+        result = scan_repo(tmp_path)
+        assert {"V2", "V11"} <= result.capabilities
+
+    def test_multiple_chapters_in_one_manifest(self, tmp_path):
+        """A manifest hitting several chapters is fully detected by either matcher."""
+        req = tmp_path / "requirements.txt"
+        req.write_text("PyJWT>=2.0\nflask_session\n")
+        result = scan_repo(tmp_path)
+        assert {"V2", "V3", "V11"} <= result.capabilities
+
+    def test_no_match_across_manifests(self, tmp_path):
+        """Signatures do not match across the boundary of two manifests."""
+        (tmp_path / "pom.xml").write_text("<project><!-- profile")
+        (tmp_path / "requirements.txt").write_text("uploader\n")
+        result = scan_repo(tmp_path)
+        assert "V5" not in result.capabilities
+
     def test_pom_xml_spring(self, tmp_path):
         """pom.xml with spring-boot adds framework."""
         pom = tmp_path / "pom.xml"
@@ -91,3 +196,67 @@ class TestScanRepo:
         pkg.write_text("not valid json {")
         result = scan_repo(tmp_path)
         assert result.frameworks == []
+
+    def test_regex_matcher_built_only_when_needed(self, tmp_path, matcher):
+        """The fused-regex matcher is compiled only on the fallback path."""
+        _regex_signatures.cache_clear()
+        (tmp_path / "requirements.txt").write_text("bcrypt\n")
+        assert "V11" in scan_repo(tmp_path).capabilities
+        assert _regex_signatures.cache_info().currsize == (matcher == "regex")
+
+
+class TestScanRepos:
+    """Tests for scan_repos batch function."""
+
+    def test_results_in_input_order(self, tmp_path):
+        """Batch scan returns one result per path, in order."""
+        react = tmp_path / "react"
+        react.mkdir()
+        (react / "package.json").write_text(json.dumps({"dependencies": {"react": "^18.0.0"}}))
+        flask = tmp_path / "flask"
+        flask.mkdir()
+        (flask / "requirements.txt").write_text("flask\n")
+
+        results = scan_repos([react, flask], max_workers=2)
+        assert [r.path for r in results] == [react, flask]
+        assert results[0].frameworks == ["React"]
+        assert results[1].frameworks == ["Flask"]
+
+    def test_empty(self):
+        """Empty batch returns an empty list."""
+        assert scan_repos([]) == []
+
+    def test_small_batch_not_chunked(self, tmp_path, monkeypatch):
+        """A batch no larger than the pool sends one path per task."""
+        seen = {}
+
+        class FakeExecutor:
+            def __init__(self, max_workers=None):
+                seen["max_workers"] = max_workers
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def map(self, fn, iterable, chunksize=1):
+                seen["chunksize"] = chunksize
+                return map(fn, iterable)
+
+        monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", FakeExecutor)
+        results = scan_repos([tmp_path] * 8, max_workers=8)
+        assert len(results) == 8
+        assert seen == {"max_workers": 8, "chunksize": 1}
+
+    def test_import_does_not_load_multiprocessing(self):
+        """Importing the scanner leaves the process-pool machinery unloaded."""
+        code = "import sys, tools.capability_scanner; print('multiprocessing' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert out.stdout.strip() == "False"
@@ -1,12 +1,14 @@
 """Unit tests for the Kademos CLI."""
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from tools.cli import (
+    _requirements_index,
     create_parser,
     get_version,
     main,
@@ -17,10 +19,9 @@ from tools.cli import (
 class TestCreateParser:
     """Tests for create_parser."""
 
-    def test_has_subcommands(self):
+    def test_has_subcommands(self, cached_parser):
         """Parser has required subcommands."""
-        parser = create_parser()
-        action = [a for a in parser._subparsers._group_actions if hasattr(a, "choices")][0]
+        action = [a for a in cached_parser._subparsers._group_actions if hasattr(a, "choices")][0]
         choices = list(action.choices.keys())
         assert "scan" in choices
         assert "interact" in choices
@@ -29,53 +30,55 @@ class TestCreateParser:
         assert "resources" in choices
         assert "config" in choices
 
-    def test_scan_defaults(self):
+    def test_scan_defaults(self, cached_parser):
         """Scan subcommand has correct defaults."""
-        parser = create_parser()
-        parsed = parser.parse_args(["scan", "."])
+        parsed = cached_parser.parse_args(["scan", "."])
         assert parsed.command == "scan"
         assert parsed.path == "."
         assert parsed.level == "2"
         assert parsed.format == "markdown"
         assert parsed.ai_context is False
 
-    def test_scan_ai_context(self):
+    def test_scan_ai_context(self, cached_parser):
         """Scan --ai-context flag."""
-        parser = create_parser()
-        parsed = parser.parse_args(["scan", "/repo", "--ai-context"])
+        parsed = cached_parser.parse_args(["scan", "/repo", "--ai-context"])
         assert parsed.ai_context is True
 
-    def test_config_set_args(self):
+    def test_config_set_args(self, cached_parser):
         """Config set subcommand parses key and value."""
-        parser = create_parser()
-        parsed = parser.parse_args(["config", "set", "default_level", "1"])
+        parsed = cached_parser.parse_args(["config", "set", "default_level", "1"])
         assert parsed.command == "config"
         assert parsed.config_action == "set"
         assert parsed.key == "default_level"
         assert parsed.value == "1"
 
-    def test_config_get_args(self):
+    def test_config_get_args(self, cached_parser):
         """Config get subcommand parses key."""
-        parser = create_parser()
-        parsed = parser.parse_args(["config", "get", "default_level"])
+        parsed = cached_parser.parse_args(["config", "get", "default_level"])
         assert parsed.command == "config"
         assert parsed.config_action == "get"
         assert parsed.key == "default_level"
 
-    def test_config_list_args(self):
+    def test_config_list_args(self, cached_parser):
         """Config list subcommand."""
-        parser = create_parser()
-        parsed = parser.parse_args(["config", "list"])
+        parsed = cached_parser.parse_args(["config", "list"])
         assert parsed.command == "config"
         assert parsed.config_action == "list"
 
-    def test_config_reset_args(self):
+    def test_config_reset_args(self, cached_parser):
         """Config reset subcommand."""
-        parser = create_parser()
-        parsed = parser.parse_args(["config", "reset"])
+        parsed = cached_parser.parse_args(["config", "reset"])
         assert parsed.command == "config"
         assert parsed.config_action == "reset"
 
+    def test_command_hint_builds_only_that_subparser(self):
+        """A command hint restricts the parser to the hinted subcommand."""
+        parser = create_parser("export")
+        action = [a for a in parser._subparsers._group_actions if hasattr(a, "choices")][0]
+        assert list(action.choices.keys()) == ["export"]
+        parsed = parser.parse_args(["export", "--format", "jira-json"])
+        assert parsed.format == "jira-json"
+
 
 class TestMain:
     """Tests for main entrypoint."""
@@ -84,16 +87,16 @@ class TestMain:
         """main() with no command returns 0 (splash)."""
         assert main([]) == 0
 
-    def test_version(self):
+    def test_version(self, cached_parser):
         """--version prints and exits."""
-        parser = create_parser()
         with pytest.raises(SystemExit) as exc:
-            parser.parse_args(["--version"])
+            cached_parser.parse_args(["--version"])
         assert exc.value.code == 0
 
-    def test_scan_runs(self, project_root):
+    def test_scan_runs(self, project_root, cached_scan):
         """kademos scan . runs successfully with repo."""
-        result = main(["scan", str(project_root), "--format", "json"])
+        with patch("tools.capability_scanner.scan_repo", return_value=cached_scan):
+            result = main(["scan", str(project_root), "--format", "json"])
         assert result == 0
 
     def test_scan_nonexistent_path(self):
@@ -101,9 +104,26 @@ class TestMain:
         result = main(["scan", "/nonexistent/path/xyz"])
         assert result == 1
 
-    def test_scan_without_base_path(self, project_root):
+    def test_scan_source_file_removed_after_lookup(self, tmp_path, project_root, cached_scan, capsys):
+        """A source file deleted after a cached lookup is reported, not raised."""
+        core = tmp_path / "01-ASVS-Core-Reference"
+        core.mkdir()
+        source = core / "ASVS-L2-Standard.json"
+        source.write_bytes((project_root / "tools" / "data" / "ASVS-L2-Standard.json").read_bytes())
+        parsed = create_parser("scan").parse_args(
+            ["scan", str(project_root), "--format", "json", "--base-path", str(tmp_path)]
+        )
+        with patch("tools.capability_scanner.scan_repo", return_value=cached_scan):
+            assert parsed.func(parsed) == 0
+            source.unlink()
+            capsys.readouterr()
+            assert parsed.func(parsed) == 1
+        assert "Error:" in capsys.readouterr().err
+
+    def test_scan_without_base_path(self, project_root, cached_scan):
         """kademos scan works without --base-path (uses bundled data)."""
-        result = main(["scan", str(project_root), "--format", "json"])
+        with patch("tools.capability_scanner.scan_repo", return_value=cached_scan):
+            result = main(["scan", str(project_root), "--format", "json"])
         assert result == 0
 
     def test_export_runs(self, project_root):
@@ -158,6 +178,35 @@ class TestMain:
         assert "STRIDE" in out.read_text()
 
 
+class TestRequirementsByLevel:
+    """Tests for the cached ASVS requirement loader."""
+
+    def test_levels_are_cumulative(self, sample_json_file):
+        """Each level bucket holds that level and all lower ones, in file order."""
+        by_level = _requirements_index(sample_json_file).by_level
+        assert [r["req_id"] for r in by_level[1]] == ["V1.1.1"]
+        assert [r["req_id"] for r in by_level[2]] == ["V1.1.1", "V1.2.1"]
+        assert [r["req_id"] for r in by_level[3]] == ["V1.1.1", "V1.2.1", "V2.1.1"]
+
+    def test_chapter_index_respects_level(self, sample_json_file):
+        """Per-level chapter buckets only hold requirements at or below that level."""
+        by_chapter = _requirements_index(sample_json_file).by_level_chapter
+        assert list(by_chapter[1]) == ["V1"]
+        assert [r["req_id"] for r in by_chapter[2]["V1"]] == ["V1.1.1", "V1.2.1"]
+        assert [r["req_id"] for r in by_chapter[3]["V2"]] == ["V2.1.1"]
+
+    def test_reloads_after_file_change(self, tmp_path):
+        """A modified file is parsed again instead of served from cache."""
+        path = tmp_path / "reqs.json"
+        path.write_text(json.dumps([{"req_id": "A", "L": "1"}]), encoding="utf-8")
+        assert [r["req_id"] for r in _requirements_index(path).by_level[1]] == ["A"]
+
+        path.write_text(json.dumps([{"req_id": "B", "L": "1"}]), encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert [r["req_id"] for r in _requirements_index(path).by_level[1]] == ["B"]
+
+
 class TestShowSplash:
     """Tests for splash screen."""
 
@@ -104,6 +104,16 @@ class TestKademosConfig:
         data = json.loads(config_path.read_text())
         assert data["default_level"] == "2"
 
+    def test_save_is_compact_by_default(self, config, config_path):
+        """The config file is written as compact JSON."""
+        config.set("default_level", "2")
+        assert config_path.read_text(encoding="utf-8") == '{"default_level":"2"}\n'
+
+    def test_save_pretty(self, config_path):
+        """pretty=True writes indented JSON."""
+        KademosConfig(config_path=config_path, pretty=True).set("default_level", "2")
+        assert config_path.read_text(encoding="utf-8") == '{\n  "default_level": "2"\n}\n'
+
     def test_set_invalid_key(self, config):
         """Setting an invalid key raises ValueError."""
         with pytest.raises(ValueError, match="Invalid config key"):
@@ -127,6 +137,26 @@ class TestKademosConfig:
         c2 = KademosConfig(config_path=config_path)
         assert c2.get("default_level") == "3"
 
+    def test_reload_sees_external_change(self, config_path):
+        """A new instance re-reads the file after it changes on disk."""
+        KademosConfig(config_path=config_path).set("default_level", "1")
+        assert KademosConfig(config_path=config_path).get("default_level") == "1"
+
+        config_path.write_text(json.dumps({"default_level": "2"}), encoding="utf-8")
+        st = config_path.stat()
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert KademosConfig(config_path=config_path).get("default_level") == "2"
+
+    def test_reload_sees_size_change_with_same_mtime(self, config_path):
+        """A rewrite that keeps the mtime but changes the size is re-read."""
+        KademosConfig(config_path=config_path).set("default_level", "1")
+        st = config_path.stat()
+        assert KademosConfig(config_path=config_path).get("default_level") == "1"
+
+        config_path.write_text(json.dumps({"output_format": "csv"}), encoding="utf-8")
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert KademosConfig(config_path=config_path).get("output_format") == "csv"
+
     def test_get_effective_config_value(self, config):
         """get_effective returns config file value when no env override."""
         config.set("default_level", "1")
@@ -169,6 +199,14 @@ class TestKademosConfig:
         entries = config.list_all()
         assert entries["default_level"]["display"] == "2"
 
+    def test_list_all_env_override(self, config):
+        """list_all reports env var values and their source."""
+        config.set("anthropic_api_key", "from-config")
+        with patch.dict(os.environ, {"KADEMOS_ANTHROPIC_KEY": "from-env-value"}):
+            entry = config.list_all()["anthropic_api_key"]
+        assert entry["value"] == "from-env-value"
+        assert entry["source"] == "env (KADEMOS_ANTHROPIC_KEY)"
+
     def test_reset(self, config, config_path):
         """reset clears config and removes file."""
         config.set("default_level", "1")
@@ -184,3 +222,14 @@ class TestKademosConfig:
         config_path.write_text("not valid json {", encoding="utf-8")
         c = KademosConfig(config_path=config_path)
         assert c.get("default_level") is None
+
+    @pytest.mark.parametrize("content", ["null", "5", '"abc"', "[1]"])
+    def test_non_object_config_file(self, config_path, content):
+        """A config file holding non-object JSON loads as empty and can be reset."""
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config_path.write_text(content, encoding="utf-8")
+        c = KademosConfig(config_path=config_path)
+        assert c.get("default_level") is None
+
+        c.reset()
+        assert not config_path.exists()
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from tools.paths import get_source_file, _bundled_data_dir, LEVEL_FILES
+from tools.paths import get_source_file, _bundled_data_dir, clear_source_file_cache, LEVEL_FILES
 
 
 class TestBundledDataDir:
@@ -61,6 +61,41 @@ class TestGetSourceFile:
         with pytest.raises(FileNotFoundError, match="Source file not found"):
             get_source_file("1", base_path=tmp_path)
 
+    def test_missing_file_not_cached(self, tmp_path):
+        """A lookup that failed succeeds once the file appears."""
+        with pytest.raises(FileNotFoundError):
+            get_source_file("1", base_path=tmp_path)
+        core = tmp_path / "01-ASVS-Core-Reference"
+        core.mkdir()
+        (core / LEVEL_FILES["1"]).write_text("[]", encoding="utf-8")
+        assert get_source_file("1", base_path=tmp_path).exists()
+
+    def test_relative_base_path_follows_cwd(self, tmp_path, monkeypatch):
+        """A relative base_path is resolved against the current directory."""
+        for name in ("a", "b"):
+            core = tmp_path / name / "01-ASVS-Core-Reference"
+            core.mkdir(parents=True)
+            (core / LEVEL_FILES["1"]).write_text("[]", encoding="utf-8")
+        monkeypatch.chdir(tmp_path / "a")
+        first = get_source_file("1", base_path=Path("."))
+        monkeypatch.chdir(tmp_path / "b")
+        second = get_source_file("1", base_path=Path("."))
+        assert first.is_absolute()
+        assert first.parent.parent == (tmp_path / "a").resolve()
+        assert second.parent.parent == (tmp_path / "b").resolve()
+
+    def test_cache_clear_forgets_removed_file(self, tmp_path):
+        """clear_source_file_cache drops lookups whose file has gone."""
+        core = tmp_path / "01-ASVS-Core-Reference"
+        core.mkdir()
+        (core / LEVEL_FILES["1"]).write_text("[]", encoding="utf-8")
+        assert get_source_file("1", base_path=tmp_path).exists()
+
+        (core / LEVEL_FILES["1"]).unlink()
+        clear_source_file_cache()
+        with pytest.raises(FileNotFoundError):
+            get_source_file("1", base_path=tmp_path)
+
 
 @pytest.fixture
 def project_root():
@@ -9,11 +9,24 @@ it automatically pulls ASVS Chapter V5 (File Handling). If it doesn't detect
 WebSockets, it completely excludes Chapter V17."
 """
 
+import functools
 import json
+import os
 import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
 
 
 # Capability signatures: (pattern, ASVS chapter_id)
@@ -38,9 +51,140 @@ CAPABILITY_SIGNATURES = [
 
 # Always-included baseline chapters (core web security)
 BASELINE_CHAPTERS = ["V1", "V2", "V3", "V14"]
+_BASELINE_SET = frozenset(BASELINE_CHAPTERS)
+
+
+def _group_signatures() -> dict[str, str]:
+    """Merge CAPABILITY_SIGNATURES into one alternation per chapter (order kept)."""
+    grouped: dict[str, list[str]] = {}
+    for pattern, chapter in CAPABILITY_SIGNATURES:
+        grouped.setdefault(chapter, []).append(pattern)
+    return {chapter: "|".join(patterns) for chapter, patterns in grouped.items()}
+
+
+# A signature alternative that is a plain literal: word characters, hyphens
+# and escaped dots only
+_LITERAL_ALTERNATIVE = re.compile(r"(?:[\w-]|\\\.)+")
+
+# An alternative simple enough to derive an anchor from: literal characters
+# plus "." wildcards and single-character quantifiers. Anything else (other
+# escapes such as \b or \s, groups, classes, braces, anchors) gets no prefilter.
+_SIMPLE_ALTERNATIVE = re.compile(r"(?:[\w.?*+-]|\\\.)+")
+
+# A run of literal characters that is not made optional by a quantifier
+_ANCHOR_RUN = re.compile(r"(?:[\w-]|\\\.)+(?![?*])")
+
+
+def _anchors(pattern: str) -> tuple[bytes, ...]:
+    """
+    Return lowercased literals, one per alternative of *pattern*, that any
+    match must contain. An empty tuple means no prefilter is possible.
+    """
+    anchors = []
+    for alternative in pattern.split("|"):
+        if not _SIMPLE_ALTERNATIVE.fullmatch(alternative):
+            return ()
+        runs = _ANCHOR_RUN.findall(alternative)
+        if not runs:
+            return ()
+        anchors.append(max(runs, key=len).replace("\\.", ".").lower().encode("ascii"))
+    return tuple(dict.fromkeys(anchors))
+
+
+def _compile_signature(pattern: str) -> tuple[Optional[re.Pattern], tuple[bytes, ...]]:
+    """
+    Compile *pattern* with its anchor prefilter.
+
+    When every alternative is a plain literal, each anchor is a whole
+    alternative, so the substring check is the answer and no regex is
+    returned.
+    """
+    anchors = _anchors(pattern)
+    if anchors and all(_LITERAL_ALTERNATIVE.fullmatch(alt) for alt in pattern.split("|")):
+        return None, anchors
+    return re.compile(pattern.encode("ascii"), re.IGNORECASE), anchors
+
+
+@functools.lru_cache(maxsize=1)
+def _regex_signatures() -> tuple[re.Pattern, tuple]:
+    """
+    Compile the regex-only matcher on first use: the fused pattern and the
+    per-pattern ``(regex, anchors, chapter)`` table.
+
+    The fused pattern has one named group per chapter, so ``match.lastgroup``
+    is the chapter id of the leftmost hit. Signatures are ASCII and compiled
+    as bytes patterns: manifests are scanned undecoded. Not built at import
+    because with pyahocorasick installed the automaton path never needs it.
+    """
+    combined = re.compile(
+        "|".join(f"(?P<{ch}>{p})" for ch, p in _group_signatures().items()).encode("ascii"),
+        re.IGNORECASE,
+    )
+    compiled = tuple(
+        (*_compile_signature(pattern), chapter) for pattern, chapter in CAPABILITY_SIGNATURES
+    )
+    return combined, compiled
+
+
+def _split_signatures() -> tuple[dict[str, tuple[str, ...]], list[tuple[str, str]]]:
+    """
+    Split CAPABILITY_SIGNATURES into literal keywords and residual regexes.
+
+    Returns ``(keywords, patterns)`` where *keywords* maps each lowercased
+    literal to the chapters it signals and *patterns* holds the alternatives
+    that still need the regex engine (e.g. ``file.?upload``).
+    """
+    keywords: dict[str, tuple[str, ...]] = {}
+    patterns: list[tuple[str, str]] = []
+    for pattern, chapter in CAPABILITY_SIGNATURES:
+        residual = []
+        for alternative in pattern.split("|"):
+            if _LITERAL_ALTERNATIVE.fullmatch(alternative):
+                keyword = alternative.replace("\\.", ".").lower()
+                if chapter not in keywords.get(keyword, ()):
+                    keywords[keyword] = keywords.get(keyword, ()) + (chapter,)
+            else:
+                residual.append(alternative)
+        if residual:
+            patterns.append(("|".join(residual), chapter))
+    return keywords, patterns
 
 
-@dataclass
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over the literal signature keywords."""
+    keywords, patterns = _split_signatures()
+    automaton = ahocorasick.Automaton()
+    for keyword, chapters in keywords.items():
+        automaton.add_word(keyword, chapters)
+    automaton.make_automaton()
+    residual = tuple(
+        (*_compile_signature(pattern), chapter) for pattern, chapter in patterns
+    )
+    return automaton, residual
+
+
+# With pyahocorasick installed, literal keywords are matched in one linear
+# automaton walk and only the non-literal alternatives go through ``re``
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON, _RESIDUAL_SIGNATURES = _build_keyword_automaton()
+else:  # pragma: no cover - optional speedup
+    _KEYWORD_AUTOMATON, _RESIDUAL_SIGNATURES = None, ()
+
+# Manifest files read by the scanner (repo root only)
+_MANIFEST_NAMES = frozenset({"package.json", "pom.xml", "requirements.txt", "requirements.in"})
+
+# Chunk size for raw manifest reads (large pom.xml files in monorepos)
+_READ_CHUNK_SIZE = 128 * 1024
+
+# orjson parses bytes directly (no UTF-8 decode step); stdlib json is the fallback
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# dataclass(slots=True) needs Python 3.10+; 3.9 keeps a regular __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ScanResult:
     """Result of a capability scan."""
     path: Path
@@ -50,40 +194,116 @@ class ScanResult:
     chapters: set[str] = field(default_factory=set)
 
 
-def _read_safe(path: Path, encoding: str = "utf-8") -> str:
-    """Read file or return empty string on error."""
+def _read_bytes(path: Union[str, Path]) -> bytes:
+    """Read a whole file with raw ``os.read`` calls (no buffered/text I/O layers)."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks: list[bytes] = []
+        while True:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _read_safe(path: Union[str, Path]) -> bytes:
+    """Read file bytes or return empty bytes on error."""
+    try:
+        return _read_bytes(path)
+    except OSError:
+        return b""
+
+
+def _find_manifests(root: Path) -> dict[str, str]:
+    """Return ``{name: path}`` for the manifest files in *root*, from one directory listing."""
     try:
-        return path.read_text(encoding=encoding)
-    except (OSError, UnicodeDecodeError):
-        return ""
+        with os.scandir(root) as entries:
+            return {
+                entry.name: entry.path
+                for entry in entries
+                if entry.name in _MANIFEST_NAMES and entry.is_file()
+            }
+    except OSError:
+        return {}
 
 
-def _parse_package_json(root: Path) -> Optional[dict]:
+def _parse_package_json(manifests: dict[str, str]) -> Optional[dict]:
     """Parse package.json if it exists."""
-    pkg = root / "package.json"
-    if not pkg.exists():
+    pkg = manifests.get("package.json")
+    if pkg is None:
         return None
     try:
-        return json.loads(pkg.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+        return _json_loads(_read_bytes(pkg))
+    except (ValueError, OSError):
+        # ValueError covers json.JSONDecodeError and orjson.JSONDecodeError
         return None
 
 
-def _parse_pom_xml(root: Path) -> str:
-    """Read pom.xml as raw text (simple pattern matching)."""
-    pom = root / "pom.xml"
-    if not pom.exists():
-        return ""
+def _parse_pom_xml(manifests: dict[str, str]) -> bytes:
+    """Read pom.xml as raw bytes (simple pattern matching)."""
+    pom = manifests.get("pom.xml")
+    if pom is None:
+        return b""
     return _read_safe(pom)
 
 
-def _parse_requirements_txt(root: Path) -> str:
-    """Read requirements.txt."""
+def _parse_requirements_txt(manifests: dict[str, str]) -> bytes:
+    """Read requirements.txt, or requirements.in if that is missing or unreadable."""
     for name in ("requirements.txt", "requirements.in"):
-        p = root / name
-        if p.exists():
-            return _read_safe(p)
-    return ""
+        path = manifests.get(name)
+        if path is None:
+            continue
+        try:
+            return _read_bytes(path)
+        except OSError:
+            continue
+    return b""
+
+
+def _signature_hit(
+    regex: Optional[re.Pattern], anchors: tuple[bytes, ...], combined: bytes, lowered: bytes, start: int = 0
+) -> bool:
+    """Check one signature: cheap substring prefilter first, regex only if needed."""
+    if anchors and not any(anchor in lowered for anchor in anchors):
+        return False
+    return regex is None or regex.search(combined, start) is not None
+
+
+def _match_signatures(combined: bytes) -> set[str]:
+    """Return the chapters whose capability signatures occur in *combined*."""
+    found: set[str] = set()
+
+    if _KEYWORD_AUTOMATON is not None:
+        # Keywords are stored lowercased; lower the content once, in one pass.
+        # The automaton takes str: latin-1 maps each byte to one code point,
+        # so ASCII keywords match exactly as they would on the raw bytes.
+        lowered = combined.lower()
+        for _, chapters in _KEYWORD_AUTOMATON.iter(lowered.decode("latin-1")):
+            found.update(chapters)
+        for regex, anchors, chapter in _RESIDUAL_SIGNATURES:
+            if chapter not in found and _signature_hit(regex, anchors, combined, lowered):
+                found.add(chapter)
+        return found
+
+    # One fused pass finds the leftmost signature hit. Nothing can match
+    # before it, so the per-pattern checks only scan from that offset, and
+    # patterns for chapters already detected are skipped. Each pattern is
+    # first prefiltered by plain substring search for its literal anchors.
+    combined_re, compiled_signatures = _regex_signatures()
+    first = combined_re.search(combined)
+    if first is not None:
+        start = first.start()
+        found.add(first.lastgroup)
+        lowered = combined.lower()
+        for regex, anchors, chapter in compiled_signatures:
+            if chapter in found:
+                continue
+            if _signature_hit(regex, anchors, combined, lowered, start):
+                found.add(chapter)
+    return found
 
 
 def scan_repo(repo_path: Path) -> ScanResult:
@@ -93,16 +313,19 @@ def scan_repo(repo_path: Path) -> ScanResult:
     """
     repo_path = Path(repo_path).resolve()
     result = ScanResult(path=repo_path)
-    result.chapters.update(BASELINE_CHAPTERS)
+    result.chapters |= _BASELINE_SET
 
     # Collect all searchable content
-    content_parts: list[str] = []
+    content_parts: list[bytes] = []
+    manifests = _find_manifests(repo_path)
 
     # package.json
-    pkg = _parse_package_json(repo_path)
+    pkg = _parse_package_json(manifests)
     if pkg:
         deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
-        content_parts.append(" ".join(deps.keys()).lower())
+        # npm package names are lowercase, so no case folding is needed
+        dep_names = " ".join(deps.keys())
+        content_parts.append(dep_names.encode("utf-8"))
         # Framework hints
         if "react" in deps or "next" in deps:
             result.frameworks.append("React")
@@ -110,32 +333,55 @@ def scan_repo(repo_path: Path) -> ScanResult:
             result.frameworks.append("Vue")
         if "express" in deps:
             result.frameworks.append("Express")
-        if "django" in str(pkg).lower():
+        if "django" in dep_names:
             result.frameworks.append("Django")
 
     # pom.xml
-    pom_content = _parse_pom_xml(repo_path)
+    pom_content = _parse_pom_xml(manifests)
     if pom_content:
-        content_parts.append(pom_content.lower())
-        if "spring-boot" in pom_content or "springframework" in pom_content:
+        content_parts.append(pom_content)
+        if b"spring-boot" in pom_content or b"springframework" in pom_content:
             result.frameworks.append("Spring")
 
     # requirements.txt
-    req_content = _parse_requirements_txt(repo_path)
+    req_content = _parse_requirements_txt(manifests)
     if req_content:
+        content_parts.append(req_content)
         req_lower = req_content.lower()
-        content_parts.append(req_lower)
-        if "django" in req_lower:
+        if b"django" in req_lower:
             result.frameworks.append("Django")
-        if "flask" in req_lower:
+        if b"flask" in req_lower:
             result.frameworks.append("Flask")
 
-    combined = " ".join(content_parts)
+    # Newline-separated: "." in signatures such as file.?upload does not match
+    # a newline, so no match can straddle two manifests
+    combined = b"\n".join(content_parts)
 
-    # Match capability signatures
-    for pattern, chapter in CAPABILITY_SIGNATURES:
-        if re.search(pattern, combined, re.IGNORECASE):
-            result.capabilities.add(chapter)
-            result.chapters.add(chapter)
+    found = _match_signatures(combined)
+    result.capabilities |= found
+    result.chapters |= found
 
     return result
+
+
+def scan_repos(paths: Iterable[Path], max_workers: Optional[int] = None) -> list[ScanResult]:
+    """
+    Scan several repositories, in parallel worker processes.
+
+    Each scan is independent file I/O plus regex work, so batches are spread
+    over a process pool (not bound by the GIL). Results keep the order of
+    *paths*. A single path is scanned in-process to skip pool start-up.
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return [scan_repo(p) for p in paths]
+    # Imported here: concurrent.futures.process pulls in multiprocessing,
+    # which single-repo ``kademos scan`` runs never need
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = max_workers or os.cpu_count() or 1
+    # Batch only when every worker still gets several chunks; small batches
+    # go one path per task so no worker sits idle
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(scan_repo, paths, chunksize=chunksize))
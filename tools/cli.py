@@ -12,19 +12,31 @@ Unified CLI entrypoint.
 """
 
 import argparse
+import functools
+import io
+import itertools
 import json
+import os
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
-
-from rich.console import Console
-from rich.table import Table
-from rich.text import Text
-from rich import box
+from typing import Any, List, Optional
 
 from tools.paths import get_source_file
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# ASVS level string -> numeric level (levels are inclusive of lower ones)
+_LEVEL_HIERARCHY = {"1": 1, "2": 2, "3": 3}
+
+# Escapes for XML element text in --ai-context output (one str.translate pass)
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
 
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
     """Return package version."""
     try:
@@ -34,8 +46,60 @@ def get_version() -> str:
         return "3.0.0"
 
 
+def _fast_json_load(path: Path) -> Any:
+    """Parse a JSON file, with orjson when installed (parses bytes, no decode step)."""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(frozen=True)
+class _RequirementIndex:
+    """Level and chapter index over one ASVS file (shared via cache; read-only)."""
+    # max_level -> requirements with L <= max_level, in file order
+    by_level: dict[int, list[dict]]
+    # max_level -> chapter_id -> those requirements, chapters in file order
+    by_level_chapter: dict[int, dict[str, list[dict]]]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_requirements(source_path: str, mtime_ns: int) -> _RequirementIndex:
+    """
+    Parse an ASVS JSON file and index its requirements by level and chapter.
+
+    Cached per ``(source_path, mtime_ns)`` so repeated calls in one process
+    skip the parse until the file changes; callers must not mutate the
+    returned lists.
+    """
+    requirements = _fast_json_load(source_path)
+
+    index = _RequirementIndex(
+        by_level={1: [], 2: [], 3: []},
+        by_level_chapter={1: {}, 2: {}, 3: {}},
+    )
+    for r in requirements:
+        if not isinstance(r, dict):
+            continue
+        level = _LEVEL_HIERARCHY.get(str(r.get("L", "2")), 99)
+        for max_level in range(level, 4):  # empty for unknown levels (99)
+            index.by_level[max_level].append(r)
+            index.by_level_chapter[max_level].setdefault(r.get("chapter_id"), []).append(r)
+    return index
+
+
+def _requirements_index(source_path: Path) -> _RequirementIndex:
+    """Return the cached requirement index for *source_path* (see :func:`_load_requirements`)."""
+    return _load_requirements(str(source_path), os.stat(source_path).st_mtime_ns)
+
+
 def show_splash(version: str) -> None:
     """Display splash screen when kademos runs with no args."""
+    from rich import box
+    from rich.console import Console
+    from rich.table import Table
+    from rich.text import Text
+
     console = Console()
     ascii_art = """
     __  __        __
@@ -91,43 +155,43 @@ def cmd_scan(parsed: argparse.Namespace) -> int:
 
     try:
         source_path = get_source_file(str(parsed.level), base_path)
-    except (ValueError, FileNotFoundError) as e:
+        # get_source_file is memoized; OSError covers a file removed since
+        index = _requirements_index(source_path)
+    except (ValueError, OSError) as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    with open(source_path, encoding="utf-8") as f:
-        requirements = json.load(f)
-
     # Filter by level; optionally narrow by detected chapters
     from tools.capability_scanner import BASELINE_CHAPTERS
 
-    level_hierarchy = {"1": 1, "2": 2, "3": 3}
-    max_level = level_hierarchy.get(str(parsed.level), 2)
-    level_filtered = [
-        r for r in requirements
-        if isinstance(r, dict)
-        and level_hierarchy.get(str(r.get("L", "2")), 99) <= max_level
-    ]
+    max_level = _LEVEL_HIERARCHY.get(str(parsed.level), 2)
     extra_chapters = result.chapters - set(BASELINE_CHAPTERS)
     if extra_chapters:
-        filtered = [r for r in level_filtered if r.get("chapter_id") in result.chapters]
+        filtered = [
+            r
+            for chapter, rows in index.by_level_chapter[max_level].items()
+            if chapter in result.chapters
+            for r in rows
+        ]
     else:
-        filtered = level_filtered
+        filtered = index.by_level[max_level]
 
     if getattr(parsed, "ai_context", False):
         # XML output for AI agents
-        lines = ['<?xml version="1.0" encoding="UTF-8"?>']
-        lines.append("<security_requirements>")
-        lines.append(f"  <tech_stack>{', '.join(result.frameworks) or 'Unknown'}</tech_stack>")
-        lines.append(f"  <capabilities>{', '.join(sorted(result.capabilities))}</capabilities>")
-        lines.append("  <requirements>")
+        buf = io.StringIO()
+        w = buf.write
+        w('<?xml version="1.0" encoding="UTF-8"?>\n')
+        w("<security_requirements>\n")
+        w(f"  <tech_stack>{', '.join(result.frameworks) or 'Unknown'}</tech_stack>\n")
+        w(f"  <capabilities>{', '.join(sorted(result.capabilities))}</capabilities>\n")
+        w("  <requirements>\n")
         for r in filtered[:50]:  # Cap for AI context
             rid = r.get("req_id", "")
-            desc = (r.get("req_description", "") or "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            lines.append(f'    <requirement id="{rid}">{desc}</requirement>')
-        lines.append("  </requirements>")
-        lines.append("</security_requirements>")
-        print("\n".join(lines))
+            desc = (r.get("req_description", "") or "").translate(_XML_ESCAPE)
+            w(f'    <requirement id="{rid}">{desc}</requirement>\n')
+        w("  </requirements>\n")
+        w("</security_requirements>\n")
+        sys.stdout.write(buf.getvalue())
         return 0
 
     # Markdown or JSON output
@@ -136,24 +200,24 @@ def cmd_scan(parsed: argparse.Namespace) -> int:
         return 0
 
     # Markdown
-    md_lines = ["# ASVS Security Requirements (Kademos Scan)", ""]
-    md_lines.append(f"**Detected:** {', '.join(result.frameworks) or 'Generic'} | Chapters: {', '.join(sorted(result.chapters))}")
-    md_lines.append("")
-    current_chapter = None
-    for r in filtered:
-        ch = r.get("chapter_id", "")
-        if ch != current_chapter:
-            current_chapter = ch
-            md_lines.append(f"## {r.get('chapter_name', ch)}")
-            md_lines.append("")
-        md_lines.append(f"- **{r.get('req_id', '')}** {r.get('req_description', '')}")
-        md_lines.append("")
-    print("\n".join(md_lines))
+    buf = io.StringIO()
+    w = buf.write
+    w("# ASVS Security Requirements (Kademos Scan)\n\n")
+    w(f"**Detected:** {', '.join(result.frameworks) or 'Generic'} | Chapters: {', '.join(sorted(result.chapters))}\n\n")
+    # Requirements are in file (chapter) order; group consecutive rows
+    for ch, rows in itertools.groupby(filtered, key=lambda r: r.get("chapter_id", "")):
+        rows = list(rows)
+        w(f"## {rows[0].get('chapter_name', ch)}\n\n")
+        for r in rows:
+            w(f"- **{r.get('req_id', '')}** {r.get('req_description', '')}\n\n")
+    sys.stdout.write(buf.getvalue())
     return 0
 
 
 def cmd_interact(parsed: argparse.Namespace) -> int:
     """Interactive TUI for generating security requirements."""
+    from rich.console import Console
+
     console = Console()
     console.print("[bold]Kademos Interactive - Feature Security Requirements[/bold]")
     console.print()
@@ -167,16 +231,14 @@ def cmd_interact(parsed: argparse.Namespace) -> int:
     base_path = getattr(parsed, "base_path", None)
     try:
         source_path = get_source_file("2", base_path)
-    except (ValueError, FileNotFoundError) as e:
+        # get_source_file is memoized; OSError covers a file removed since
+        index = _requirements_index(source_path)
+    except (ValueError, OSError) as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    with open(source_path, encoding="utf-8") as f:
-        requirements = json.load(f)
-
     # Include V2 (Authentication) and V3 (Session) as default for "password reset" type prompts
-    level2_reqs = [r for r in requirements if isinstance(r, dict) and str(r.get("L", "")) in ("1", "2")]
-    sample = level2_reqs[:30]
+    sample = index.by_level[2][:30]
 
     output_path = Path(parsed.output) if getattr(parsed, "output", None) else Path("SECURITY_REQUIREMENTS.md")
     lines = [
@@ -252,19 +314,27 @@ def cmd_resources(parsed: argparse.Namespace) -> int:
         from tools.paths import _bundled_data_dir
         core = _bundled_data_dir()
 
-    if not core.exists():
+    try:
+        with os.scandir(core) as entries:
+            names = sorted(e.name for e in entries if e.name.endswith(".json") and e.is_file())
+    except OSError:
         print(f"ASVS reference not found at {core}", file=sys.stderr)
         return 1
-    for f in sorted(core.glob("*.json")):
+    for name in names:
         if base_path:
-            print(f"  {f.relative_to(Path(base_path).resolve())}")
+            # Listed relative to base_path, i.e. "01-ASVS-Core-Reference/<name>"
+            print(f"  {os.path.join(core.name, name)}")
         else:
-            print(f"  {f.name}")
+            print(f"  {name}")
     return 0
 
 
 def cmd_config(parsed: argparse.Namespace) -> int:
     """Manage LLM API keys and settings."""
+    from rich import box
+    from rich.console import Console
+    from rich.table import Table
+
     from tools.config import KademosConfig, VALID_KEYS
 
     console = Console()
@@ -334,8 +404,22 @@ def cmd_config(parsed: argparse.Namespace) -> int:
         return 0
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser with subcommands."""
+_COMMANDS = ("scan", "interact", "threatmodel", "export", "resources", "config")
+
+
+def _command_hint(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named by argv[0], or None if it is not a known command."""
+    if argv and argv[0] in _COMMANDS:
+        return argv[0]
+    return None
+
+
+def create_parser(command_hint: Optional[str] = None) -> argparse.ArgumentParser:
+    """Create the main argument parser with subcommands.
+
+    When command_hint names a subcommand, only that subparser is built; with no
+    hint (e.g. for --help or an unknown command) every subparser is built.
+    """
     parser = argparse.ArgumentParser(
         prog="kademos",
         description="Kademos - Agentic AI Security Requirements Engine",
@@ -346,66 +430,72 @@ def create_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command", title="commands", metavar="<command>")
 
     # scan
-    sp_scan = subparsers.add_parser("scan", help="Scan a repository to map context to ASVS requirements")
-    sp_scan.add_argument("path", nargs="?", default=".", help="Repository path (default: current dir)")
-    sp_scan.add_argument("--level", choices=["1", "2", "3"], default="2", help="ASVS level (default: 2)")
-    sp_scan.add_argument("--format", choices=["markdown", "json"], default="markdown", help="Output format")
-    sp_scan.add_argument("--ai-context", action="store_true", help="Output XML for AI agents")
-    sp_scan.add_argument("--base-path", type=Path, help="Base path for ASVS reference files")
-    sp_scan.set_defaults(func=cmd_scan)
+    if command_hint in (None, "scan"):
+        sp_scan = subparsers.add_parser("scan", help="Scan a repository to map context to ASVS requirements")
+        sp_scan.add_argument("path", nargs="?", default=".", help="Repository path (default: current dir)")
+        sp_scan.add_argument("--level", choices=["1", "2", "3"], default="2", help="ASVS level (default: 2)")
+        sp_scan.add_argument("--format", choices=["markdown", "json"], default="markdown", help="Output format")
+        sp_scan.add_argument("--ai-context", action="store_true", help="Output XML for AI agents")
+        sp_scan.add_argument("--base-path", type=Path, help="Base path for ASVS reference files")
+        sp_scan.set_defaults(func=cmd_scan)
 
     # interact
-    sp_interact = subparsers.add_parser("interact", help="Interactive TUI for generating security requirements")
-    sp_interact.add_argument("--output", type=Path, default=Path("SECURITY_REQUIREMENTS.md"), help="Output file")
-    sp_interact.add_argument("--base-path", type=Path, help="Base path for ASVS reference files")
-    sp_interact.set_defaults(func=cmd_interact)
+    if command_hint in (None, "interact"):
+        sp_interact = subparsers.add_parser("interact", help="Interactive TUI for generating security requirements")
+        sp_interact.add_argument("--output", type=Path, default=Path("SECURITY_REQUIREMENTS.md"), help="Output file")
+        sp_interact.add_argument("--base-path", type=Path, help="Base path for ASVS reference files")
+        sp_interact.set_defaults(func=cmd_interact)
 
     # threatmodel
-    sp_tm = subparsers.add_parser("threatmodel", help="Generate scoped LLM prompts for STRIDE modeling")
-    sp_tm.add_argument("--tech-stack", default="Web application", help="Tech stack description")
-    sp_tm.add_argument("--output", type=Path, default=Path("threat_model_prompt.txt"), help="Output file")
-    sp_tm.add_argument("--base-path", type=Path, help="Base path for ASVS reference files")
-    sp_tm.set_defaults(func=cmd_threatmodel)
+    if command_hint in (None, "threatmodel"):
+        sp_tm = subparsers.add_parser("threatmodel", help="Generate scoped LLM prompts for STRIDE modeling")
+        sp_tm.add_argument("--tech-stack", default="Web application", help="Tech stack description")
+        sp_tm.add_argument("--output", type=Path, default=Path("threat_model_prompt.txt"), help="Output file")
+        sp_tm.add_argument("--base-path", type=Path, help="Base path for ASVS reference files")
+        sp_tm.set_defaults(func=cmd_threatmodel)
 
     # export
-    sp_export = subparsers.add_parser("export", help="Export requirements to CSV/Jira JSON")
-    sp_export.add_argument("--level", choices=["1", "2", "3"], default="2", help="ASVS level")
-    sp_export.add_argument("--format", choices=["csv", "jira-json"], default="csv", help="Output format")
-    sp_export.add_argument("--output", type=Path, help="Output file (default: stdout)")
-    sp_export.add_argument("--base-path", type=Path, help="Base path for ASVS reference files")
-    sp_export.set_defaults(func=cmd_export)
+    if command_hint in (None, "export"):
+        sp_export = subparsers.add_parser("export", help="Export requirements to CSV/Jira JSON")
+        sp_export.add_argument("--level", choices=["1", "2", "3"], default="2", help="ASVS level")
+        sp_export.add_argument("--format", choices=["csv", "jira-json"], default="csv", help="Output format")
+        sp_export.add_argument("--output", type=Path, help="Output file (default: stdout)")
+        sp_export.add_argument("--base-path", type=Path, help="Base path for ASVS reference files")
+        sp_export.set_defaults(func=cmd_export)
 
     # resources
-    sp_res = subparsers.add_parser("resources", help="Manage ASVS reference files and drift detection")
-    sp_res.add_argument("--drift", action="store_true", help="Check drift against upstream")
-    sp_res.add_argument("--format", choices=["text", "json"], default="text", help="Output format")
-    sp_res.add_argument("--offline", action="store_true", help="Skip upstream fetch")
-    sp_res.add_argument("--upstream-url", type=str, help="URL to fetch upstream ASVS")
-    sp_res.add_argument("--base-path", type=Path, help="Base path for ASVS reference files")
-    sp_res.set_defaults(func=cmd_resources)
+    if command_hint in (None, "resources"):
+        sp_res = subparsers.add_parser("resources", help="Manage ASVS reference files and drift detection")
+        sp_res.add_argument("--drift", action="store_true", help="Check drift against upstream")
+        sp_res.add_argument("--format", choices=["text", "json"], default="text", help="Output format")
+        sp_res.add_argument("--offline", action="store_true", help="Skip upstream fetch")
+        sp_res.add_argument("--upstream-url", type=str, help="URL to fetch upstream ASVS")
+        sp_res.add_argument("--base-path", type=Path, help="Base path for ASVS reference files")
+        sp_res.set_defaults(func=cmd_resources)
 
     # config
-    sp_config = subparsers.add_parser("config", help="Manage LLM API keys and settings")
-    config_sub = sp_config.add_subparsers(dest="config_action")
+    if command_hint in (None, "config"):
+        sp_config = subparsers.add_parser("config", help="Manage LLM API keys and settings")
+        config_sub = sp_config.add_subparsers(dest="config_action")
 
-    sp_config_set = config_sub.add_parser("set", help="Set a configuration value")
-    sp_config_set.add_argument("key", help="Configuration key")
-    sp_config_set.add_argument("value", help="Value to set")
+        sp_config_set = config_sub.add_parser("set", help="Set a configuration value")
+        sp_config_set.add_argument("key", help="Configuration key")
+        sp_config_set.add_argument("value", help="Value to set")
 
-    sp_config_get = config_sub.add_parser("get", help="Get a configuration value")
-    sp_config_get.add_argument("key", help="Configuration key")
+        sp_config_get = config_sub.add_parser("get", help="Get a configuration value")
+        sp_config_get.add_argument("key", help="Configuration key")
 
-    config_sub.add_parser("list", help="List all configuration")
-    config_sub.add_parser("reset", help="Reset all configuration")
+        config_sub.add_parser("list", help="List all configuration")
+        config_sub.add_parser("reset", help="Reset all configuration")
 
-    sp_config.set_defaults(func=cmd_config)
+        sp_config.set_defaults(func=cmd_config)
 
     return parser
 
 
 def main(args: Optional[List[str]] = None) -> int:
     """Main entry point for the unified CLI."""
-    parser = create_parser()
+    parser = create_parser(_command_hint(sys.argv[1:] if args is None else args))
     parsed = parser.parse_args(args)
 
     if not parsed.command:
@@ -30,6 +30,9 @@ ENV_OVERRIDES: dict[str, str] = {
     "KADEMOS_ANTHROPIC_KEY": "anthropic_api_key",
 }
 
+# Reverse of ENV_OVERRIDES: config key → env-var name
+_CONFIG_KEY_TO_ENV: dict[str, str] = {v: k for k, v in ENV_OVERRIDES.items()}
+
 # Keys whose values should be masked in list output
 _SENSITIVE_KEYS = {"openai_api_key", "anthropic_api_key"}
 
@@ -37,6 +40,14 @@ _SENSITIVE_KEYS = {"openai_api_key", "anthropic_api_key"}
 _VALID_LEVELS = {"1", "2", "3"}
 _VALID_FORMATS = {"markdown", "json", "csv", "jira-json"}
 
+# Pre-joined choices for validation error messages
+_VALID_KEYS_TEXT = ", ".join(sorted(VALID_KEYS))
+_VALID_LEVELS_TEXT = ", ".join(sorted(_VALID_LEVELS))
+_VALID_FORMATS_TEXT = ", ".join(sorted(_VALID_FORMATS))
+
+# Parsed config files for this process: path → ((st_mtime_ns, st_size), data)
+_LOAD_CACHE: dict[Path, tuple[tuple[int, int], dict[str, str]]] = {}
+
 
 def _config_dir() -> Path:
     """Return the configuration directory, respecting XDG_CONFIG_HOME."""
@@ -61,43 +72,63 @@ def _mask_value(value: str) -> str:
 def _validate_key(key: str) -> None:
     """Raise ValueError if key is not a valid configuration key."""
     if key not in VALID_KEYS:
-        valid = ", ".join(sorted(VALID_KEYS))
-        raise ValueError(f"Invalid config key: '{key}'. Valid keys: {valid}")
+        raise ValueError(f"Invalid config key: '{key}'. Valid keys: {_VALID_KEYS_TEXT}")
 
 
 def _validate_value(key: str, value: str) -> None:
     """Raise ValueError if value is invalid for the given key."""
     if key == "default_level" and value not in _VALID_LEVELS:
-        raise ValueError(f"Invalid level: '{value}'. Must be one of: {', '.join(sorted(_VALID_LEVELS))}")
+        raise ValueError(f"Invalid level: '{value}'. Must be one of: {_VALID_LEVELS_TEXT}")
     if key == "output_format" and value not in _VALID_FORMATS:
-        raise ValueError(f"Invalid format: '{value}'. Must be one of: {', '.join(sorted(_VALID_FORMATS))}")
+        raise ValueError(f"Invalid format: '{value}'. Must be one of: {_VALID_FORMATS_TEXT}")
 
 
 class KademosConfig:
     """Manages Kademos configuration stored as JSON on disk."""
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, pretty: bool = False):
         self._path = config_path or _config_path()
+        self._pretty = pretty
         self._data: dict[str, str] = {}
         self._load()
 
     def _load(self) -> None:
-        """Load configuration from disk. Creates empty config if missing."""
-        if self._path.exists():
-            try:
-                self._data = json.loads(self._path.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                self._data = {}
-        else:
+        """
+        Load configuration from disk. Creates empty config if missing.
+
+        Parsed files are cached per path and reused while the file's
+        modification time and size are unchanged.
+        """
+        try:
+            st = os.stat(self._path)
+        except OSError:
             self._data = {}
+            return
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        cached = _LOAD_CACHE.get(self._path)
+        if cached is not None and cached[0] == stamp:
+            self._data = dict(cached[1])
+            return
+
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            self._data = {}
+            return
+        # A file holding valid JSON that is not an object is treated as empty
+        self._data = data if isinstance(data, dict) else {}
+        _LOAD_CACHE[self._path] = (stamp, dict(self._data))
 
     def _save(self) -> None:
-        """Persist configuration to disk."""
+        """Persist configuration to disk (compact JSON unless *pretty* was set)."""
+        _LOAD_CACHE.pop(self._path, None)
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(
-            json.dumps(self._data, indent=2) + "\n",
-            encoding="utf-8",
-        )
+        if self._pretty:
+            text = json.dumps(self._data, indent=2)
+        else:
+            text = json.dumps(self._data, separators=(",", ":"))
+        self._path.write_bytes((text + "\n").encode("utf-8"))
 
     def get(self, key: str) -> Optional[str]:
         """Get a config value by key (file only, no env override)."""
@@ -112,11 +143,11 @@ class KademosConfig:
         """
         _validate_key(key)
         # Check env overrides
-        for env_var, config_key in ENV_OVERRIDES.items():
-            if config_key == key:
-                env_val = os.environ.get(env_var)
-                if env_val:
-                    return env_val
+        env_var = _CONFIG_KEY_TO_ENV.get(key)
+        if env_var:
+            env_val = os.environ.get(env_var)
+            if env_val:
+                return env_val
         return self._data.get(key)
 
     def set(self, key: str, value: str) -> None:
@@ -138,14 +169,12 @@ class KademosConfig:
             entry: dict[str, Any] = {"description": desc, "value": None, "source": "not set"}
 
             # Check env override first
-            env_val = None
-            for env_var, config_key in ENV_OVERRIDES.items():
-                if config_key == key:
-                    env_val = os.environ.get(env_var)
-                    if env_val:
-                        entry["value"] = env_val
-                        entry["source"] = f"env ({env_var})"
-                    break
+            env_var = _CONFIG_KEY_TO_ENV.get(key)
+            if env_var:
+                env_val = os.environ.get(env_var)
+                if env_val:
+                    entry["value"] = env_val
+                    entry["source"] = f"env ({env_var})"
 
             # Fall back to config file
             if entry["value"] is None and key in self._data:
@@ -166,5 +195,6 @@ class KademosConfig:
     def reset(self) -> None:
         """Remove all configuration values and delete the config file."""
         self._data = {}
+        _LOAD_CACHE.pop(self._path, None)
         if self._path.exists():
             self._path.unlink()
@@ -6,6 +6,7 @@ Single source of truth for locating ASVS JSON reference files.
 Resolves bundled package data first, with optional base-path override.
 """
 
+import functools
 import importlib.resources
 from pathlib import Path
 from typing import Optional
@@ -19,6 +20,7 @@ LEVEL_FILES = {
 }
 
 
+@functools.lru_cache(maxsize=1)
 def _bundled_data_dir() -> Path:
     """Return the path to the bundled data directory inside the package."""
     ref = importlib.resources.files("tools.data")
@@ -40,20 +42,44 @@ def get_source_file(level: str, base_path: Optional[Path] = None) -> Path:
         level: ASVS level — must be ``"1"``, ``"2"``, or ``"3"``.
         base_path: Optional explicit base directory (repo root or custom).
 
+    Successful lookups are memoized for the life of the process: a file
+    deleted or moved afterwards is not re-checked, so callers that change
+    files on disk should call :func:`clear_source_file_cache`, and readers
+    should still expect :class:`OSError` when opening the returned path.
+    Failed lookups are not cached.
+
     Returns:
         Resolved :class:`~pathlib.Path` to the JSON file.
 
     Raises:
         ValueError: If *level* is not ``1``, ``2``, or ``3``.
-        FileNotFoundError: If the resolved file does not exist.
+        FileNotFoundError: If the resolved file does not exist at lookup time.
     """
+    if base_path is not None:
+        if not isinstance(base_path, Path):
+            base_path = Path(base_path)
+        # Relative paths depend on the cwd, so resolve them before the cached
+        # lookup; absolute paths are used as the cache key as given
+        if not base_path.is_absolute():
+            base_path = base_path.resolve()
+    return _find_source_file(level, base_path)
+
+
+def clear_source_file_cache() -> None:
+    """Forget cached :func:`get_source_file` lookups (e.g. after files change on disk)."""
+    _find_source_file.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _find_source_file(level: str, base_path: Optional[Path]) -> Path:
+    """Cached lookup behind :func:`get_source_file` (*base_path* is absolute)."""
     if level not in LEVEL_FILES:
         raise ValueError(f"Invalid level: {level}. Must be 1, 2, or 3")
 
     filename = LEVEL_FILES[level]
 
     if base_path is not None:
-        p = Path(base_path).resolve() / "01-ASVS-Core-Reference" / filename
+        p = base_path.resolve() / "01-ASVS-Core-Reference" / filename
     else:
         p = _bundled_data_dir() / filename
 